@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import json
+import functools
 import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     server_host: Optional[str]
     server_user: Optional[str]
@@ -32,15 +34,30 @@ def _default_config_path() -> Path:
     return base_dir / "config.json"
 
 
-def _load_json(path: Path) -> dict:
+_MISSING_MTIME_NS = -1
+
+
+@functools.lru_cache(maxsize=4)
+def _load_json_cached(path_str: str, mtime_ns: int) -> dict:
+    # mtime_ns is only part of the cache key, so an edited file is parsed again.
+    if mtime_ns == _MISSING_MTIME_NS:
+        return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return orjson.loads(Path(path_str).read_bytes())
     except FileNotFoundError:
         return {}
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return {}
 
 
+def _load_json(path: Path) -> dict:
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = _MISSING_MTIME_NS
+    return _load_json_cached(str(path), mtime_ns)
+
+
 def _env_bool(value: Optional[str]) -> Optional[bool]:
     if value is None:
         return None
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import sys
 import threading
 import webbrowser
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
+import orjson
 import uvicorn
 from fastapi import FastAPI
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from .config import AppConfig, load_config
-from .poller import GpuPoller
+from .poller import GpuPoller, _now_iso
 
 
 def _resource_path(relative: str) -> Path:
@@ -23,18 +24,21 @@ def _resource_path(relative: str) -> Path:
     return base / relative
 
 
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-
-
 class AppState:
     def __init__(self, config: AppConfig) -> None:
-        self._lock = threading.Lock()
-        self._data: Optional[dict] = None
-        self._error: Optional[str] = None
-        self._last_update: Optional[str] = None
         self._config = config
         self._config_errors = self._validate_config()
+        self._static = {
+            "config_errors": self._config_errors,
+            "server": {
+                "host": self._config.server_host,
+                "port": self._config.server_port,
+                "user": self._config.server_user,
+            },
+            "poll_interval": self._config.poll_interval,
+        }
+        self._full = self._compose(None, None, None)
+        self._cached_json: Optional[Tuple[dict, bytes]] = None
 
     def _validate_config(self) -> list[str]:
         errors = []
@@ -47,26 +51,25 @@ class AppState:
         return errors
 
     def update(self, data: Optional[dict], error: Optional[str]) -> None:
-        with self._lock:
-            self._data = data
-            self._error = error
-            self._last_update = _now_iso()
-
-    def snapshot(self) -> dict:
-        with self._lock:
-            return {
-                "ok": self._error is None and self._data is not None,
-                "error": self._error,
-                "last_update": self._last_update,
-                "config_errors": self._config_errors,
-                "data": self._data,
-                "server": {
-                    "host": self._config.server_host,
-                    "port": self._config.server_port,
-                    "user": self._config.server_user,
-                },
-                "poll_interval": self._config.poll_interval,
-            }
+        self._full = self._compose(data, error, _now_iso())
+
+    def snapshot_bytes(self) -> bytes:
+        full = self._full
+        cached = self._cached_json
+        if cached is not None and cached[0] is full:
+            return cached[1]
+        body = orjson.dumps(full)
+        self._cached_json = (full, body)
+        return body
+
+    def _compose(self, data: Optional[dict], error: Optional[str], last_update: Optional[str]) -> dict:
+        return {
+            "ok": error is None and data is not None,
+            "error": error,
+            "last_update": last_update,
+            "data": data,
+            **self._static,
+        }
 
 
 config = load_config()
@@ -75,42 +78,46 @@ app = FastAPI()
 static_dir = _resource_path("static")
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
-_poll_thread: Optional[threading.Thread] = None
+_HEALTH_PREFIX = b'{"ok":true,"timestamp":"'
+_HEALTH_SUFFIX = b'"}'
+
+_poll_task: Optional[asyncio.Task] = None
 _poller: Optional[GpuPoller] = None
 
 
 @app.on_event("startup")
-def _on_startup() -> None:
-    global _poll_thread
+async def _on_startup() -> None:
+    global _poll_task
     global _poller
 
     def _update(data: Optional[dict], error: Optional[str]) -> None:
         state.update(data, error)
 
     _poller = GpuPoller(config, _update)
-    _poll_thread = threading.Thread(target=_poller.run, daemon=True)
-    _poll_thread.start()
+    _poll_task = asyncio.create_task(_poller.run())
 
 
 @app.on_event("shutdown")
-def _on_shutdown() -> None:
+async def _on_shutdown() -> None:
+    if _poll_task is not None:
+        _poll_task.cancel()
     if _poller is not None:
-        _poller.stop()
+        await _poller.stop()
 
 
 @app.get("/")
-def index() -> FileResponse:
+async def index() -> FileResponse:
     return FileResponse(static_dir / "index.html")
 
 
 @app.get("/api/status")
-def api_status() -> JSONResponse:
-    return JSONResponse(state.snapshot())
+async def api_status() -> Response:
+    return Response(state.snapshot_bytes(), media_type="application/json")
 
 
 @app.get("/api/health")
-def api_health() -> JSONResponse:
-    return JSONResponse({"ok": True, "timestamp": _now_iso()})
+async def api_health() -> Response:
+    return Response(_HEALTH_PREFIX + _now_iso().encode() + _HEALTH_SUFFIX, media_type="application/json")
 
 
 def _open_browser(url: str) -> None:
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import csv
-import io
+import asyncio
+import math
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
-import paramiko
+import asyncssh
 
 from .config import AppConfig
 
@@ -21,87 +21,138 @@ GPU_QUERY_FIELDS = [
     "power.draw",
     "power.limit",
     "fan.speed",
+    "driver_version",
 ]
 
+_IDX = {name: i for i, name in enumerate(GPU_QUERY_FIELDS)}
+_IDX_INDEX = _IDX["index"]
+_IDX_NAME = _IDX["name"]
+_IDX_TEMP = _IDX["temperature.gpu"]
+_IDX_UTIL = _IDX["utilization.gpu"]
+_IDX_MEM_TOTAL = _IDX["memory.total"]
+_IDX_MEM_USED = _IDX["memory.used"]
+_IDX_POWER_DRAW = _IDX["power.draw"]
+_IDX_POWER_LIMIT = _IDX["power.limit"]
+_IDX_FAN = _IDX["fan.speed"]
+_IDX_DRIVER = _IDX["driver_version"]
+
+# With nounits, nvidia-smi brackets these sentinels; keep both spellings.
+_NA_VALUES = frozenset({"N/A", "Not Supported", "[N/A]", "[Not Supported]"})
+
+_END_MARKER = "__GPU_MONITOR_END__"
+
+# driver_version is queried as a column here, so each poll is a single nvidia-smi invocation.
+_GPU_QUERY_CMD = "LC_ALL=C nvidia-smi --query-gpu=" + ",".join(GPU_QUERY_FIELDS) + " --format=csv,noheader,nounits"
+
 
 def _parse_csv_rows(text: str) -> List[List[str]]:
-    rows: List[List[str]] = []
-    reader = csv.reader(io.StringIO(text))
-    for row in reader:
-        if not row:
-            continue
-        rows.append([cell.strip() for cell in row])
-    return rows
+    return [[cell.strip() for cell in line.split(",")] for line in text.splitlines() if line]
 
 
-def _safe_float(value: str) -> Optional[float]:
-    if not value:
-        return None
-    value = value.strip()
-    if value in {"N/A", "Not Supported"}:
-        return None
+def _parse_int_required(value: str) -> Optional[int]:
     try:
-        return float(value)
+        return int(value)
     except ValueError:
         return None
 
 
-def _safe_int(value: str) -> Optional[int]:
-    number = _safe_float(value)
-    if number is None:
+def _parse_float_maybe_na(value: str) -> Optional[float]:
+    if not value or value in _NA_VALUES:
+        return None
+    try:
+        return float(value)
+    except ValueError:
         return None
-    return int(round(number))
 
 
-def _normalize_gpu_row(fields: List[str], row: List[str]) -> Dict[str, Optional[float]]:
-    raw = dict(zip(fields, row))
-    memory_total = _safe_float(raw.get("memory.total", ""))
-    memory_used = _safe_float(raw.get("memory.used", ""))
+def _normalize_gpu_row(row: List[str]) -> Tuple[Optional[str], Dict[str, Optional[float]]]:
+    if len(row) < len(GPU_QUERY_FIELDS):
+        row = row + [""] * (len(GPU_QUERY_FIELDS) - len(row))
+    driver_version = row[_IDX_DRIVER] or None
+    memory_total = _parse_int_required(row[_IDX_MEM_TOTAL])
+    memory_used = _parse_int_required(row[_IDX_MEM_USED])
 
     memory_util = None
     if memory_total and memory_total > 0 and memory_used is not None:
         memory_util = round((memory_used / memory_total) * 100, 1)
 
-    return {
-        "index": _safe_int(raw.get("index", "")),
-        "name": raw.get("name") or "Unknown",
-        "temperature_c": _safe_float(raw.get("temperature.gpu", "")),
-        "utilization_gpu": _safe_float(raw.get("utilization.gpu", "")),
+    return driver_version, {
+        "index": _parse_int_required(row[_IDX_INDEX]),
+        "name": row[_IDX_NAME] or "Unknown",
+        "temperature_c": _parse_int_required(row[_IDX_TEMP]),
+        "utilization_gpu": _parse_int_required(row[_IDX_UTIL]),
         "memory_total_mb": memory_total,
         "memory_used_mb": memory_used,
         "memory_utilization": memory_util,
-        "power_draw_w": _safe_float(raw.get("power.draw", "")),
-        "power_limit_w": _safe_float(raw.get("power.limit", "")),
-        "fan_speed_pct": _safe_float(raw.get("fan.speed", "")),
+        "power_draw_w": _parse_float_maybe_na(row[_IDX_POWER_DRAW]),
+        "power_limit_w": _parse_float_maybe_na(row[_IDX_POWER_LIMIT]),
+        "fan_speed_pct": _parse_float_maybe_na(row[_IDX_FAN]),
     }
 
 
+def _agg_python(gpus: List[Dict[str, Optional[float]]]) -> Tuple[float, float, float, float, float, float]:
+    util_sum = temp_sum = power_sum = 0.0
+    util_n = temp_n = power_n = 0
+    memory_used = memory_total = 0.0
+    for gpu in gpus:
+        util = gpu["utilization_gpu"]
+        if util is not None:
+            util_sum += util
+            util_n += 1
+        temp = gpu["temperature_c"]
+        if temp is not None:
+            temp_sum += temp
+            temp_n += 1
+        power = gpu["power_draw_w"]
+        if power is not None:
+            power_sum += power
+            power_n += 1
+        memory_used += gpu["memory_used_mb"] or 0
+        memory_total += gpu["memory_total_mb"] or 0
+    util_avg = util_sum / util_n if util_n else math.nan
+    temp_avg = temp_sum / temp_n if temp_n else math.nan
+    power_avg = power_sum / power_n if power_n else math.nan
+    memory_util = memory_used / memory_total * 100 if memory_total > 0 else math.nan
+    return util_avg, temp_avg, power_avg, memory_used, memory_total, memory_util
+
+
+def _round_or_none(value: float, digits: int) -> Optional[float]:
+    if math.isnan(value):
+        return None
+    return round(float(value), digits)
+
+
 def _summarize_gpus(gpus: List[Dict[str, Optional[float]]]) -> Dict[str, Optional[float]]:
-    def _avg(values: List[Optional[float]]) -> Optional[float]:
-        filtered = [v for v in values if v is not None]
-        if not filtered:
-            return None
-        return round(sum(filtered) / len(filtered), 2)
-
-    memory_used = sum(gpu["memory_used_mb"] or 0 for gpu in gpus)
-    memory_total = sum(gpu["memory_total_mb"] or 0 for gpu in gpus)
-    memory_util = None
-    if memory_total > 0:
-        memory_util = round((memory_used / memory_total) * 100, 1)
+    util_avg, temp_avg, power_avg, memory_used, memory_total, memory_util = _agg_python(gpus)
 
     return {
         "gpu_count": len(gpus),
-        "memory_used_mb": round(memory_used, 1),
-        "memory_total_mb": round(memory_total, 1),
-        "memory_utilization": memory_util,
-        "utilization_avg": _avg([gpu["utilization_gpu"] for gpu in gpus]),
-        "temperature_avg": _avg([gpu["temperature_c"] for gpu in gpus]),
-        "power_draw_avg": _avg([gpu["power_draw_w"] for gpu in gpus]),
+        "memory_used_mb": round(float(memory_used), 1),
+        "memory_total_mb": round(float(memory_total), 1),
+        "memory_utilization": _round_or_none(memory_util, 1),
+        "utilization_avg": _round_or_none(util_avg, 2),
+        "temperature_avg": _round_or_none(temp_avg, 2),
+        "power_draw_avg": _round_or_none(power_avg, 2),
     }
 
 
+_MAX_SLEEP_MULT = 10
+
+
+def _poll_signature(data: Optional[dict]) -> Optional[tuple]:
+    if data is None:
+        return None
+    return tuple(
+        (gpu["utilization_gpu"], gpu["temperature_c"], round(gpu["memory_used_mb"] or 0, -1))
+        for gpu in data["gpus"]
+    )
+
+
+_ISO_FMT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return datetime.now(timezone.utc).strftime(_ISO_FMT)
 
 
 class GpuPoller:
@@ -109,22 +160,39 @@ class GpuPoller:
         self._config = config
         self._update_callback = update_callback
         self._stop = False
-        self._client: Optional[paramiko.SSHClient] = None
+        self._conn: Optional[asyncssh.SSHClientConnection] = None
+        self._shell: Optional[asyncssh.SSHClientProcess] = None
+        self._driver_version: Optional[str] = None
+        self._last_sig: Optional[tuple] = None
+        self._sleep_mult = 1
 
-    def stop(self) -> None:
+    async def stop(self) -> None:
         self._stop = True
+        conn = self._conn
         self._disconnect()
+        if conn is not None:
+            await conn.wait_closed()
 
-    def run(self) -> None:
+    async def run(self) -> None:
         while not self._stop:
             start = time.time()
-            data, error = self._collect()
+            data, error = await self._collect()
             self._update_callback(data, error)
+            self._update_backoff(data)
             elapsed = time.time() - start
-            sleep_for = max(self._config.poll_interval - elapsed, 0.1)
-            time.sleep(sleep_for)
+            sleep_for = max(self._config.poll_interval * self._sleep_mult - elapsed, 0.1)
+            await asyncio.sleep(sleep_for)
+
+    def _update_backoff(self, data: Optional[dict]) -> None:
+        # Back off while readings stay unchanged; any change or error restores the base interval.
+        sig = _poll_signature(data)
+        if sig is not None and sig == self._last_sig:
+            self._sleep_mult = min(self._sleep_mult * 2, _MAX_SLEEP_MULT)
+        else:
+            self._sleep_mult = 1
+        self._last_sig = sig
 
-    def _collect(self) -> Tuple[Optional[dict], Optional[str]]:
+    async def _collect(self) -> Tuple[Optional[dict], Optional[str]]:
         missing = []
         if not self._config.server_host:
             missing.append("server_host")
@@ -141,82 +209,79 @@ class GpuPoller:
 
         try:
             if not self._is_connected():
-                self._connect()
-            command = (
-                "LC_ALL=C nvidia-smi --query-gpu="
-                + ",".join(GPU_QUERY_FIELDS)
-                + " --format=csv,noheader,nounits"
-            )
-            output = self._exec(command)
+                await self._connect()
+            output = await self._exec(_GPU_QUERY_CMD)
             rows = _parse_csv_rows(output)
-            gpus = [_normalize_gpu_row(GPU_QUERY_FIELDS, row) for row in rows]
+            normalized = [_normalize_gpu_row(row) for row in rows]
+            gpus = [gpu for _, gpu in normalized]
             summary = _summarize_gpus(gpus)
-            driver_version = self._fetch_driver_version()
+            if self._driver_version is None and normalized:
+                # The driver cannot change under a live SSH session, so keep the first value seen.
+                self._driver_version = normalized[0][0]
             data = {
                 "timestamp": _now_iso(),
                 "gpus": gpus,
                 "summary": summary,
-                "driver_version": driver_version,
+                "driver_version": self._driver_version,
             }
             return data, None
         except Exception as exc:  # pylint: disable=broad-except
             self._disconnect()
-            return None, str(exc)
+            return None, str(exc) or type(exc).__name__
 
-    def _connect(self) -> None:
-        client = paramiko.SSHClient()
-        if self._config.allow_unknown_hosts:
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        else:
-            client.load_system_host_keys()
-        client.connect(
-            hostname=self._config.server_host,
+    async def _connect(self) -> None:
+        self._driver_version = None
+        key_path = self._config.server_key_path
+        self._conn = await asyncssh.connect(
+            self._config.server_host,
             port=self._config.server_port,
             username=self._config.server_user,
             password=self._config.server_password,
-            key_filename=self._config.server_key_path,
-            timeout=self._config.ssh_connect_timeout,
-            banner_timeout=self._config.ssh_connect_timeout,
-            auth_timeout=self._config.ssh_connect_timeout,
+            client_keys=[key_path] if key_path else (),
+            known_hosts=None if self._config.allow_unknown_hosts else (),
+            connect_timeout=self._config.ssh_connect_timeout,
+            login_timeout=self._config.ssh_connect_timeout,
+            keepalive_interval=10,
         )
-        transport = client.get_transport()
-        if transport is not None:
-            transport.set_keepalive(10)
-        self._client = client
+        # No PTY is requested, so the shell neither echoes input nor prints prompts.
+        self._shell = await self._conn.create_process("sh", stderr=asyncssh.DEVNULL, errors="replace")
 
     def _disconnect(self) -> None:
-        if self._client is None:
-            return
-        try:
-            self._client.close()
-        finally:
-            self._client = None
+        shell, self._shell = self._shell, None
+        conn, self._conn = self._conn, None
+        self._driver_version = None
+        if shell is not None:
+            shell.close()
+        if conn is not None:
+            conn.close()
 
     def _is_connected(self) -> bool:
-        if self._client is None:
-            return False
-        transport = self._client.get_transport()
-        return transport is not None and transport.is_active()
+        return self._conn is not None and self._shell is not None and not self._conn.is_closed()
 
-    def _exec(self, command: str) -> str:
-        if self._client is None:
+    async def _exec(self, command: str) -> str:
+        if self._shell is None:
             raise RuntimeError("SSH client not connected")
-        stdin, stdout, stderr = self._client.exec_command(command, timeout=self._config.ssh_command_timeout)
-        stdin.close()
-        output = stdout.read().decode("utf-8", errors="replace")
-        error = stderr.read().decode("utf-8", errors="replace")
-        exit_status = stdout.channel.recv_exit_status()
+        # stdout passes through fd 3 while stderr is captured into $_gm_err; the assignment's
+        # status is the command's, and the captured text is only printed back on failure.
+        self._shell.stdin.write(f"{{ _gm_err=$({command} 2>&1 1>&3 3>&-); }} 3>&1; echo {_END_MARKER}$?\n")
+        output, exit_status = await asyncio.wait_for(self._read_until_marker(), self._config.ssh_command_timeout)
         if exit_status != 0:
+            self._shell.stdin.write(f'printf "%s\\n" "$_gm_err"; echo {_END_MARKER}$?\n')
+            error, _ = await asyncio.wait_for(self._read_until_marker(), self._config.ssh_command_timeout)
             message = error.strip() or f"Command failed with exit code {exit_status}"
             raise RuntimeError(message)
         return output
 
-    def _fetch_driver_version(self) -> Optional[str]:
-        try:
-            output = self._exec("LC_ALL=C nvidia-smi --query-gpu=driver_version --format=csv,noheader")
-            rows = _parse_csv_rows(output)
-            if rows and rows[0]:
-                return rows[0][0]
-        except Exception:
-            return None
-        return None
+    async def _read_until_marker(self) -> Tuple[str, int]:
+        lines: List[str] = []
+        while True:
+            line = await self._shell.stdout.readline()
+            if not line:
+                raise RuntimeError("SSH shell closed")
+            marker_at = line.find(_END_MARKER)
+            if marker_at < 0:
+                lines.append(line)
+                continue
+            lines.append(line[:marker_at])
+            status = line[marker_at + len(_END_MARKER):].strip()
+            return "".join(lines), int(status) if status.isdigit() else -1